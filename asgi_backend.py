@@ -0,0 +1,393 @@
+"""
+ASGI entry point serving the same /api/public/* contract as backend.py on an
+async MySQL pool (aiomysql), so a single worker keeps many requests in flight
+while they wait on the database instead of parking a thread per request.
+
+- Catalog reads (products, categories, health benefits, product detail, best
+  sellers) run natively on the async pool; a listing's COUNT and page queries
+  run concurrently on two connections
+- With DB_REPLICAS, the reads the Flask app sends to replicas go to one async
+  pool per replica, chosen by backend's ReplicaSet health checks, with the
+  same fallback to the primary
+- Endpoints answered from in-process state that already has a sync
+  implementation (search index, facets, home feed, memory listing engine,
+  cart quotes) run in the thread pool
+- Everything else (orders, order status, internal endpoints) is served by the
+  Flask app mounted underneath, so there is one implementation of each
+- Query building, serialization, the catalog cache and the JSON encoding are
+  the ones backend.py uses, so both apps return identical bodies and ETags
+- Requests are traced like the Flask app's (Server-Timing, /metrics)
+
+Run with:
+	pip install -r requirements-asgi.txt
+	uvicorn asgi_backend:app --host 127.0.0.1 --port 5000 --workers 1
+"""
+import asyncio
+import contextlib
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiomysql
+from a2wsgi import WSGIMiddleware
+from flask import Flask
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Mount, Route
+from werkzeug.http import parse_etags
+
+import backend
+from backend import _env_float, _env_int, catalog_cache
+
+
+_pool: Optional[aiomysql.Pool] = None
+# ReplicaSet name -> pool; empty without DB_REPLICAS
+_replica_pools: Dict[str, aiomysql.Pool] = {}
+_inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+# Encodes exactly like the Flask app: same provider, same compact output
+# (the provider only keeps a weak reference to its app)
+_json_app = Flask(__name__)
+_json = backend.json_provider_class()(_json_app)
+
+
+async def open_pool(config: Optional[Dict[str, Any]] = None) -> aiomysql.Pool:
+	config = config or backend.get_db_config()
+	return await aiomysql.create_pool(
+		host=config["host"],
+		port=config["port"],
+		user=config["user"],
+		password=config["password"],
+		db=config["database"],
+		charset=config["charset"],
+		cursorclass=aiomysql.DictCursor,
+		autocommit=True,
+		connect_timeout=config["connect_timeout"],
+		minsize=0,
+		maxsize=_env_int("DB_POOL_SIZE", 10),
+		pool_recycle=_env_int("DB_POOL_RECYCLE", 3600),
+	)
+
+
+async def acquire_replica() -> Tuple[Any, Optional[aiomysql.Pool]]:
+	"""
+	Async backend.ReplicaSet.acquire: a connection to the next healthy replica
+	and its pool, or (None, None) to use the primary when there is no healthy
+	replica, its pool stays busy for DB_REPLICA_TIMEOUT, or connecting fails
+	(which takes the replica out until its next good check).
+	"""
+	replicas = backend.get_replicas()
+	replica = replicas.choose() if replicas is not None else None
+	pool = _replica_pools.get(replica["name"]) if replica is not None else None
+	if pool is None:
+		return None, None
+	try:
+		return await asyncio.wait_for(pool.acquire(), _env_float("DB_REPLICA_TIMEOUT", 2.0)), pool
+	except asyncio.TimeoutError:
+		return None, None
+	except aiomysql.MySQLError as e:
+		replicas.mark_failed(replica, e)
+		return None, None
+
+
+async def query(sql: str, params: Any = None, readonly: bool = False) -> List[Dict[str, Any]]:
+	"""
+	Run one read on a pooled connection. readonly=True prefers a healthy
+	replica like backend.open_db(readonly=True). Waiting longer than
+	DB_POOL_TIMEOUT for a primary connection raises backend.PoolTimeout
+	(answered with 503).
+	"""
+	with backend.span("db_acquire"):
+		conn, pool = (await acquire_replica()) if readonly else (None, None)
+		if conn is None:
+			pool = _pool
+			try:
+				conn = await asyncio.wait_for(_pool.acquire(), _env_float("DB_POOL_TIMEOUT", 10.0))
+			except asyncio.TimeoutError:
+				raise backend.PoolTimeout("No database connection available") from None
+	try:
+		async with conn.cursor() as cursor:
+			started = time.perf_counter()
+			await cursor.execute(sql, params)
+			rows = list(await cursor.fetchall())
+			backend.record_statement(sql, params, len(rows), time.perf_counter() - started)
+			return rows
+	finally:
+		pool.release(conn)
+
+
+async def cached(key: Tuple[Any, ...], load: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+	"""
+	catalog_cache.get_or_load for coroutines: concurrent misses for the same
+	key share one load, and None results are not cached.
+	"""
+	value = catalog_cache.get(key)
+	if value is not None:
+		return value
+	future = _inflight.get(key)
+	if future is None:
+		async def load_and_store() -> Any:
+			try:
+				result = await load()
+				if result is not None:
+					catalog_cache.set(key, result, ttl)
+				return result
+			finally:
+				_inflight.pop(key, None)
+
+		future = _inflight[key] = asyncio.ensure_future(load_and_store())
+	return await asyncio.shield(future)
+
+
+def json_response(request: Request, payload: Any, endpoint: Optional[str] = None, status: int = 200) -> Response:
+	"""
+	JSON response with the Flask app's conditional GET behaviour for catalog
+	endpoints: strong ETag from the body, Cache-Control, 304 when it matches.
+	Compressed like the Flask app's, with the encoding in the ETag.
+	"""
+	body = _json.response(payload).get_data()
+	headers: Dict[str, str] = {}
+	encoding = None
+	if status == 200 and backend.compressible("application/json", len(body)):
+		headers["Vary"] = "Accept-Encoding"
+		encoding = backend.negotiate_encoding(request.headers.get("accept-encoding"))
+	cache_control = backend.cache_control_for(endpoint) if status == 200 else None
+	if cache_control is not None:
+		etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+		if encoding:
+			etag = f"{etag}-{encoding}"
+		headers.update({"ETag": f'"{etag}"', "Cache-Control": cache_control})
+		if_none_match = request.headers.get("if-none-match")
+		if if_none_match is not None and parse_etags(if_none_match).contains(etag):
+			return Response(status_code=304, headers=headers)
+	if encoding:
+		with backend.span("compress"):
+			body = backend.compress_body(body, encoding)
+		headers["Content-Encoding"] = encoding
+	return Response(body, status_code=status, headers=headers, media_type="application/json")
+
+
+async def products_by_ids(ids: List[int]) -> Dict[int, Dict[str, Any]]:
+	"""Async backend.products_by_ids: cache first, then one IN query."""
+	found: Dict[int, Dict[str, Any]] = {}
+	misses = []
+	for product_id in ids:
+		product = catalog_cache.get(("product", product_id))
+		if product is None:
+			misses.append(product_id)
+		else:
+			found[product_id] = product
+	if misses:
+		rows = await query(
+			f"""
+			SELECT {backend.PRODUCT_COLUMNS}
+			FROM products p
+			LEFT JOIN categories c ON p.category_id = c.id
+			WHERE p.id IN ({', '.join(['%s'] * len(misses))})
+			""",
+			misses,
+			readonly=not backend.recently_written(misses),
+		)
+		ttl = _env_float("CACHE_TTL_PRODUCT", 120.0)
+		for row in rows:
+			product = backend.serialize_product(row)
+			catalog_cache.set(("product", row["id"]), product, ttl)
+			found[row["id"]] = product
+	return found
+
+
+def traced(endpoint: str, handler: Callable[[Request], Awaitable[Response]]) -> Callable[[Request], Awaitable[Response]]:
+	"""
+	Wrap a route in the Flask app's request tracing: spans, Server-Timing,
+	/metrics histograms (under the Flask endpoint name) and slow-request logs.
+	"""
+	async def run(request: Request) -> Response:
+		trace, token = backend.start_trace(endpoint, sample=False)
+		status = 500
+		try:
+			response = await handler(request)
+			status = response.status_code
+		finally:
+			total = backend.end_trace(trace, token, request.method, status)
+		if _env_int("SERVER_TIMING", 1):
+			response.headers["Server-Timing"] = trace.server_timing(total)
+		return response
+
+	return run
+
+
+async def public_products(request: Request) -> Response:
+	args = request.query_params
+	if "ids" in args:
+		try:
+			ids = backend.parse_id_list(args.get("ids") or "", _env_int("BATCH_MAX_IDS", 100))
+		except ValueError as e:
+			return json_response(request, {"error": f"Invalid ids: {e}"}, status=400)
+		try:
+			fields = backend.parse_fields(args)
+		except ValueError as e:
+			return json_response(request, {"error": str(e)}, status=400)
+		return json_response(request, backend.batch_payload(ids, await products_by_ids(ids), fields), "public_products")
+
+	try:
+		if (args.get("search") or "").strip() and backend.search_engine_for(args) == "index":
+			# May refresh the search index from MySQL
+			plan = await run_in_threadpool(backend.plan_listing, args)
+		else:
+			plan = backend.plan_listing(args)
+	except ValueError as e:
+		return json_response(request, {"error": str(e)}, status=400)
+
+	if plan["memory"]:
+		products, total = await run_in_threadpool(
+			backend.catalog_columns.page, args, plan["sort_by"], plan["sort_order"], plan["offset"], plan["limit"]
+		)
+		payload = backend.listing_payload(plan, products, total, serialized=True)
+	else:
+		total = catalog_cache.get(plan["count_key"]) if plan["include_total"] else None
+		if plan["include_total"] and total is None:
+			count_rows, rows = await asyncio.gather(
+				query(plan["count_sql"], plan["count_params"], readonly=True),
+				query(plan["page_sql"], plan["page_params"], readonly=True),
+			)
+			total = count_rows[0]["c"]
+			catalog_cache.set(plan["count_key"], total, _env_float("COUNT_CACHE_TTL", 300.0))
+		else:
+			rows = await query(plan["page_sql"], plan["page_params"], readonly=True)
+		payload = backend.listing_payload(plan, rows, total)
+
+	if backend._arg_bool(args, "facets", False):
+		payload["facets"] = await run_in_threadpool(backend.facet_counts, args, plan["search_ids"])
+	return json_response(request, payload, "public_products")
+
+
+async def public_categories(request: Request) -> Response:
+	async def load() -> List[Dict[str, Any]]:
+		rows = await query(backend.CATEGORIES_SQL, readonly=True)
+		return [{"id": r["id"], "name": r["name"], "product_count": r["product_count"] or 0} for r in rows]
+
+	categories = await cached(("categories",), load, _env_float("CACHE_TTL_CATEGORIES", 300.0))
+	return json_response(request, {"categories": categories}, "public_categories")
+
+
+async def public_health_benefits(request: Request) -> Response:
+	async def load() -> List[Dict[str, Any]]:
+		rows = await query(backend.HEALTH_BENEFITS_SQL, readonly=True)
+		return [{"id": r["id"], "name": r["name"]} for r in rows]
+
+	health_benefits = await cached(("health_benefits",), load, _env_float("CACHE_TTL_HEALTH_BENEFITS", 600.0))
+	return json_response(request, {"health_benefits": health_benefits}, "public_health_benefits")
+
+
+async def public_product_detail(request: Request) -> Response:
+	product_id = request.path_params["product_id"]
+
+	async def load() -> Optional[Dict[str, Any]]:
+		rows = await query(backend.PRODUCT_DETAIL_SQL, (product_id,), readonly=not backend.recently_written([product_id]))
+		return backend.serialize_product(rows[0]) if rows else None
+
+	product = await cached(("product", product_id), load, _env_float("CACHE_TTL_PRODUCT", 120.0))
+	if not product:
+		return json_response(request, {"error": "Not found"}, status=404)
+	return json_response(request, {"product": product}, "public_product_detail")
+
+
+async def public_best_sellers(request: Request) -> Response:
+	try:
+		window = int(request.query_params.get("window", backend.BEST_SELLER_WINDOWS[0]))
+		limit = min(max(int(request.query_params.get("limit", 8)), 1), 50)
+	except ValueError:
+		return json_response(request, {"error": "window and limit must be integers"}, status=400)
+	if window not in backend.BEST_SELLER_WINDOWS:
+		windows = ", ".join(map(str, backend.BEST_SELLER_WINDOWS))
+		return json_response(request, {"error": f"window must be one of {windows}"}, status=400)
+
+	async def load() -> List[Dict[str, Any]]:
+		sales = await query(backend.BEST_SELLERS_SQL, (window, limit))
+		details = await products_by_ids([r["product_id"] for r in sales])
+		return [
+			{**details[r["product_id"]], "units_sold": int(r["units_sold"])}
+			for r in sales
+			if r["product_id"] in details
+		]
+
+	products = await cached(("best_sellers", window, limit), load, _env_float("CACHE_TTL_BEST_SELLERS", 300.0))
+	return json_response(request, {"window": window, "products": products}, "public_best_sellers")
+
+
+async def public_home(request: Request) -> Response:
+	return json_response(request, await run_in_threadpool(backend.home_feed.get), "public_home")
+
+
+async def public_search_suggest(request: Request) -> Response:
+	q = (request.query_params.get("q") or "").strip()
+	limit = min(max(int(request.query_params.get("limit", 8) or 8), 1), 20)
+	suggestions = await run_in_threadpool(backend.search_index.suggest, q, limit) if q else []
+	return json_response(request, {"suggestions": suggestions}, "public_search_suggest")
+
+
+async def cart_quote(request: Request) -> Response:
+	try:
+		data = await request.json()
+	except ValueError:
+		data = None
+	try:
+		quantities = backend.order_quantities(data if isinstance(data, dict) else {})
+	except backend.OrderError as e:
+		return json_response(request, {"error": str(e), **e.details}, status=e.status)
+	# May refresh the price table from MySQL
+	quote = await run_in_threadpool(backend.price_table.quote, quantities)
+	return json_response(request, {"quote": quote})
+
+
+async def health(request: Request) -> Response:
+	return PlainTextResponse("ok")
+
+
+async def pool_timeout(request: Request, exc: Exception) -> Response:
+	return json_response(request, {"error": str(exc)}, status=503)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+	global _pool
+	# Like create_app(), start without touching the database: aiomysql
+	# connects lazily with minsize=0
+	_pool = await open_pool()
+	replicas = backend.get_replicas()
+	for name, config in replicas.configs() if replicas is not None else []:
+		_replica_pools[name] = await open_pool(config)
+	try:
+		yield
+	finally:
+		for pool in [_pool, *_replica_pools.values()]:
+			pool.close()
+			await pool.wait_closed()
+		_replica_pools.clear()
+
+
+def create_asgi_app() -> Starlette:
+	return Starlette(
+		routes=[
+			Route("/health", health),
+			Route("/api/public/products", traced("public_products", public_products)),
+			Route("/api/public/search/suggest", traced("public_search_suggest", public_search_suggest)),
+			Route("/api/public/categories", traced("public_categories", public_categories)),
+			Route("/api/public/health-benefits", traced("public_health_benefits", public_health_benefits)),
+			Route("/api/public/home", traced("public_home", public_home)),
+			Route("/api/public/best-sellers", traced("public_best_sellers", public_best_sellers)),
+			Route("/api/public/product/{product_id:int}", traced("public_product_detail", public_product_detail)),
+			Route("/api/public/cart/quote", traced("cart_quote", cart_quote), methods=["POST"]),
+			# Orders, order status and /api/internal/* stay on the Flask app
+			Mount("/", app=WSGIMiddleware(backend.create_app())),
+		],
+		middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+		exception_handlers={backend.PoolTimeout: pool_timeout},
+		lifespan=lifespan,
+	)
+
+
+app = create_asgi_app()
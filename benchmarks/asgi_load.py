@@ -0,0 +1,160 @@
+"""
+Load comparison of the sync Flask app and the ASGI app (asgi_backend.py).
+
+Every client connection replays the homepage's parallel fetches (featured
+products, categories, health benefits) plus a filtered listing, for a fixed
+duration, against each app in turn. Reports throughput, p50/p99 latency and
+errors per app. Both apps need the same database; nothing is written.
+
+Usage:
+    # start both apps on one worker each and compare them
+    python benchmarks/asgi_load.py --spawn [--concurrency 64] [--duration 20]
+
+    # or point it at apps you started yourself, e.g.
+    #   gunicorn -w 1 --threads 16 -b :5101 "backend:create_app()"
+    #   uvicorn asgi_backend:app --workers 1 --port 5102
+    python benchmarks/asgi_load.py --sync-url http://127.0.0.1:5101 --async-url http://127.0.0.1:5102
+
+Set CACHE_TTL_*=0 / COUNT_CACHE_TTL=0 in the environment to measure database
+round trips rather than cache hits.
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = [
+    "/api/public/products?featured=true&per_page=4",
+    "/api/public/categories",
+    "/api/public/health-benefits",
+    "/api/public/products?page=2&per_page=20&sort_by=price&sort_order=asc",
+]
+
+
+def spawn(kind, port):
+    if kind == "sync":
+        command = [
+            sys.executable, "-c",
+            f"import backend; backend.create_app().run(host='127.0.0.1', port={port}, threaded=True)",
+        ]
+    else:
+        command = [
+            sys.executable, "-m", "uvicorn", "asgi_backend:app",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", "1", "--log-level", "warning",
+        ]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url + "/health", timeout=1).read()
+            return process, url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"{kind} app did not start on port {port}")
+
+
+def client(base_url, stop_at, latencies, errors, lock):
+    target = urllib.parse.urlparse(base_url)
+    conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    local = []
+    failed = 0
+    i = 0
+    while time.monotonic() < stop_at:
+        path = PATHS[i % len(PATHS)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                failed += 1
+                continue
+            local.append(time.perf_counter() - started)
+        except (OSError, http.client.HTTPException):
+            failed += 1
+            conn.close()
+            conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    conn.close()
+    with lock:
+        latencies.extend(local)
+        errors.append(failed)
+
+
+def run(base_url, concurrency, duration):
+    # Warm caches, pools and the search/facet indexes once
+    for path in PATHS:
+        urllib.request.urlopen(base_url + path, timeout=30).read()
+    latencies, errors, lock = [], [], threading.Lock()
+    stop_at = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=client, args=(base_url, stop_at, latencies, errors, lock))
+        for _ in range(concurrency)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    latencies.sort()
+    p99 = latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] if latencies else float("nan")
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else float("nan"),
+        "p99_ms": p99 * 1000,
+        "errors": sum(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sync-url")
+    parser.add_argument("--async-url")
+    parser.add_argument("--spawn", action="store_true", help="start both apps locally on ports 5101/5102")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0)
+    args = parser.parse_args()
+
+    processes = []
+    targets = []
+    try:
+        if args.spawn:
+            for kind, port in (("sync", 5101), ("asgi", 5102)):
+                process, url = spawn(kind, port)
+                processes.append(process)
+                targets.append((kind, url))
+        else:
+            if not (args.sync_url and args.async_url):
+                parser.error("pass --spawn or both --sync-url and --async-url")
+            targets = [("sync", args.sync_url), ("asgi", args.async_url)]
+
+        results = [(kind, run(url, args.concurrency, args.duration)) for kind, url in targets]
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+    print("=" * 60)
+    print(f"Homepage + listing mix, {args.concurrency} connections, {args.duration:.0f}s each")
+    print("=" * 60)
+    print(f"  {'app':6} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+    for kind, result in results:
+        print(f"  {kind:6} {result['rps']:10.1f} {result['p50_ms']:10.2f} {result['p99_ms']:10.2f} {result['errors']:8d}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
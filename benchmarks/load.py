@@ -0,0 +1,259 @@
+"""
+Load test for the public API with a realistic, weighted traffic mix.
+
+Every client connection picks routes by weight (listing variants, search,
+suggest, product detail, batch lookup, categories, health benefits, home,
+best sellers, cart quotes, health) with ids and search terms discovered from
+the running app, for a fixed duration. Reports throughput and p50/p95/p99 latency per
+route and overall. Checkout (POST /api/public/orders) writes orders and
+decrements stock, so it is only in the mix with --checkout.
+
+Seed a throwaway database first (benchmarks/seed.py), start the app against
+it, then e.g.:
+    python benchmarks/load.py --url http://127.0.0.1:5000 --save baseline.json
+    # ... change something, restart ...
+    python benchmarks/load.py --url http://127.0.0.1:5000 --baseline baseline.json
+
+Usage:
+    python benchmarks/load.py --url URL [--concurrency 32] [--duration 30]
+                              [--routes listing,search_index] [--checkout]
+                              [--save FILE] [--baseline FILE] [--tolerance 20]
+
+With --baseline, exits non-zero if any route's p95 grew, or overall
+throughput fell, by more than --tolerance percent.
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+
+class Sample:
+    """
+    Ids and words discovered from the app, for building request paths.
+    """
+
+    def __init__(self, base_url):
+        def get(path):
+            with urllib.request.urlopen(base_url + path, timeout=30) as response:
+                return json.load(response)
+
+        products = get("/api/public/products?per_page=100&include_total=false")["products"]
+        if not products:
+            raise RuntimeError("the catalog is empty; seed it with benchmarks/seed.py")
+        self.product_ids = [p["id"] for p in products]
+        self.category_ids = [c["id"] for c in get("/api/public/categories")["categories"]] or [1]
+        self.benefit_ids = [b["id"] for b in get("/api/public/health-benefits")["health_benefits"]] or [1]
+        self.words = sorted({w for p in products for w in p["name"].lower().split() if len(w) > 3 and w.isalpha()}) or ["herbal"]
+
+
+def listing_filtered(rng, s):
+    filters = rng.choice([
+        f"category_id={rng.choice(s.category_ids)}",
+        f"health_benefit_id={rng.choice(s.benefit_ids)}",
+        f"min_price={rng.choice([100, 250, 500])}&max_price={rng.choice([1000, 2000])}",
+    ])
+    return f"/api/public/products?{filters}&sort_by={rng.choice(['price', 'name', 'created_at'])}&sort_order={rng.choice(['asc', 'desc'])}"
+
+
+def checkout_body(rng, s):
+    items = [{"product_id": product_id, "quantity": 1} for product_id in rng.sample(s.product_ids, rng.randint(1, 3))]
+    return {
+        "customer_name": "Load Test",
+        "customer_email": "load-test@example.com",
+        "customer_phone": "9000000000",
+        "shipping_address": "1 Bench Street, Test City",
+        "items": items,
+    }
+
+
+# POST routes -> body builder
+BODIES = {
+    "cart_quote": lambda rng, s: {"items": checkout_body(rng, s)["items"]},
+    "checkout": checkout_body,
+}
+
+# name -> (weight, method, path builder, accepted statuses)
+ROUTES = {
+    "listing": (20, "GET", lambda rng, s: "/api/public/products?page=1&per_page=20", (200,)),
+    "listing_filtered": (10, "GET", listing_filtered, (200,)),
+    "listing_deep": (3, "GET", lambda rng, s: f"/api/public/products?page={rng.randint(2, 50)}&per_page=20", (200,)),
+    "listing_cursor": (3, "GET", lambda rng, s: "/api/public/products?cursor=&per_page=20&sort_by=price&sort_order=asc", (200,)),
+    "listing_facets": (4, "GET", lambda rng, s: f"/api/public/products?facets=true&category_id={rng.choice(s.category_ids)}", (200,)),
+    "listing_memory": (4, "GET", lambda rng, s: f"/api/public/products?listing_engine=memory&page={rng.randint(1, 10)}&sort_by=price", (200,)),
+    "search_like": (6, "GET", lambda rng, s: f"/api/public/products?search={rng.choice(s.words)}", (200,)),
+    "search_index": (6, "GET", lambda rng, s: f"/api/public/products?search={rng.choice(s.words)}&search_mode=index", (200,)),
+    "suggest": (8, "GET", lambda rng, s: f"/api/public/search/suggest?q={rng.choice(s.words)[:rng.randint(2, 4)]}", (200,)),
+    "product": (15, "GET", lambda rng, s: f"/api/public/product/{rng.choice(s.product_ids)}", (200,)),
+    "batch": (5, "GET", lambda rng, s: "/api/public/products?ids=" + ",".join(map(str, rng.sample(s.product_ids, min(8, len(s.product_ids))))), (200,)),
+    "categories": (4, "GET", lambda rng, s: "/api/public/categories", (200,)),
+    "health_benefits": (3, "GET", lambda rng, s: "/api/public/health-benefits", (200,)),
+    "home": (6, "GET", lambda rng, s: "/api/public/home", (200,)),
+    "best_sellers": (3, "GET", lambda rng, s: f"/api/public/best-sellers?window={rng.choice([7, 30])}", (200,)),
+    "health": (1, "GET", lambda rng, s: "/health", (200,)),
+    "cart_quote": (4, "POST", lambda rng, s: "/api/public/cart/quote", (200,)),
+    # 409 (out of stock) is a correct answer under load, not an error
+    "checkout": (2, "POST", lambda rng, s: "/api/public/orders", (201, 202, 409)),
+}
+
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)] if values else float("nan")
+
+
+def client(base_url, routes, sample, seed, stop_at, results, lock):
+    target = urllib.parse.urlparse(base_url)
+    conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    rng = random.Random(seed)
+    names = list(routes)
+    weights = [routes[name][0] for name in names]
+    local = {name: ([], [0]) for name in names}
+    while time.monotonic() < stop_at:
+        name = rng.choices(names, weights)[0]
+        _, method, build, accepted = routes[name]
+        path = build(rng, sample)
+        body, headers = None, {}
+        if method == "POST":
+            body = json.dumps(BODIES[name](rng, sample))
+            headers["Content-Type"] = "application/json"
+        latencies, errors = local[name]
+        started = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status not in accepted:
+                errors[0] += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+        except (OSError, http.client.HTTPException):
+            errors[0] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    conn.close()
+    with lock:
+        for name, (latencies, errors) in local.items():
+            results[name][0].extend(latencies)
+            results[name][1] += errors[0]
+
+
+def run(base_url, routes, concurrency, duration, seed=0):
+    """
+    Drive the mix for duration seconds and return
+    {"elapsed", "routes": {name: {requests, rps, p50_ms, p95_ms, p99_ms, errors}}, "total": {...}}.
+    """
+    sample = Sample(base_url)
+    # Warm caches, pools and the search/facet indexes once per route
+    rng = random.Random(seed)
+    for name, (_, method, build, _) in routes.items():
+        if method == "GET":
+            urllib.request.urlopen(base_url + build(rng, sample), timeout=60).read()
+
+    results = {name: [[], 0] for name in routes}
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=client, args=(base_url, routes, sample, seed + i, stop_at, results, lock))
+        for i in range(concurrency)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    def summarize(latencies, errors):
+        latencies.sort()
+        return {
+            "requests": len(latencies),
+            "rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "errors": errors,
+        }
+
+    every = [latency for latencies, _ in results.values() for latency in latencies]
+    return {
+        "elapsed": elapsed,
+        "routes": {name: summarize(latencies, errors) for name, (latencies, errors) in results.items()},
+        "total": summarize(every, sum(errors for _, errors in results.values())),
+    }
+
+
+def regressions(result, baseline, tolerance):
+    limit = 1 + tolerance / 100
+    found = []
+    for name, current in result["routes"].items():
+        before = baseline["routes"].get(name)
+        # Too few samples for a stable p95
+        if not before or before["requests"] < 20 or current["requests"] < 20:
+            continue
+        if current["p95_ms"] > before["p95_ms"] * limit:
+            found.append(f"{name}: p95 {before['p95_ms']:.2f} -> {current['p95_ms']:.2f} ms")
+    if result["total"]["rps"] * limit < baseline["total"]["rps"]:
+        found.append(f"throughput: {baseline['total']['rps']:.1f} -> {result['total']['rps']:.1f} req/s")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--routes", help=f"comma-separated subset of: {', '.join(ROUTES)}")
+    parser.add_argument("--checkout", action="store_true", help="include POST /api/public/orders (writes orders)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare against a JSON file written by --save")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="allowed regression, percent")
+    args = parser.parse_args()
+
+    names = args.routes.split(",") if args.routes else [name for name in ROUTES if name != "checkout" or args.checkout]
+    unknown = [name for name in names if name not in ROUTES]
+    if unknown:
+        parser.error(f"unknown route(s): {', '.join(unknown)}")
+    if "checkout" in names and not args.checkout:
+        parser.error("checkout writes orders; pass --checkout as well")
+    routes = {name: ROUTES[name] for name in names}
+
+    try:
+        result = run(args.url.rstrip("/"), routes, args.concurrency, args.duration, args.seed)
+    except (OSError, RuntimeError) as e:
+        print(f"FAIL: {e}")
+        return 1
+
+    print("=" * 78)
+    print(f"Public API mix, {args.concurrency} connections, {result['elapsed']:.0f}s")
+    print("=" * 78)
+    print(f"  {'route':18} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, stats in list(result["routes"].items()) + [("TOTAL", result["total"])]:
+        print(
+            f"  {name:18} {stats['requests']:9d} {stats['rps']:9.1f} {stats['p50_ms']:9.2f}"
+            f" {stats['p95_ms']:9.2f} {stats['p99_ms']:9.2f} {stats['errors']:7d}"
+        )
+    print("=" * 78)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"concurrency": args.concurrency, **result}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            found = regressions(result, json.load(f), args.tolerance)
+        if found:
+            print(f"FAIL: regressions over {args.tolerance:.0f}%")
+            for line in found:
+                print(f"  {line}")
+            return 1
+        print(f"OK (within {args.tolerance:.0f}% of {args.baseline})")
+    return 1 if result["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
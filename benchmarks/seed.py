@@ -0,0 +1,230 @@
+"""
+Seed a synthetic catalog into a local MySQL/MariaDB for benchmarking.
+
+Creates (when missing) the products and product_health_benefits tables with
+the columns the backend reads, applies the backend's migrations, then inserts
+categories, health benefits, products, health-benefit links and an order
+history, and rebuilds the best-sellers rollup. Data is deterministic for a
+given --seed, so runs on different machines or commits are comparable.
+
+The database comes from the backend's usual DB_* / DATABASE_URL settings.
+Use a throwaway database, e.g.:
+    docker run -d --name storefront-bench -p 3307:3306 \\
+        -e MARIADB_ROOT_PASSWORD=bench -e MARIADB_DATABASE=storefront_bench mariadb:11
+    DB_HOSTNAME=127.0.0.1 DB_PORT=3307 DB_USER=root DB_PASSWORD=bench DB_NAME=storefront_bench \\
+        python benchmarks/seed.py --products 100000 --orders 50000
+
+Usage:
+    python benchmarks/seed.py [--products 10000] [--orders 20000] [--reset]
+
+Refuses to touch a database that already has products unless --reset is
+given, which deletes every row in the catalog and order tables first.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend  # noqa: E402
+
+CATALOG_TABLES = """
+CREATE TABLE IF NOT EXISTS products (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    slug VARCHAR(255),
+    base_price DECIMAL(10, 2),
+    sale_price DECIMAL(10, 2),
+    base_currency VARCHAR(10) DEFAULT '₹',
+    description TEXT,
+    short_description VARCHAR(500),
+    stock_quantity INT,
+    featured TINYINT(1) NOT NULL DEFAULT 0,
+    category_id INT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    thumbnail_url VARCHAR(500),
+    image_url VARCHAR(500),
+    sku VARCHAR(64),
+    is_active TINYINT(1) NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS product_health_benefits (
+    product_id INT NOT NULL,
+    health_benefit_id INT NOT NULL,
+    PRIMARY KEY (product_id, health_benefit_id)
+)
+"""
+
+# Deleted children first; order_items/product_sales_daily reference products
+RESET_TABLES = ["product_sales_daily", "order_items", "orders", "product_health_benefits", "products", "health_benefits", "categories"]
+
+CATEGORIES = [
+    "Immunity Boosters", "Beauty & Radiance", "Sleep & Relaxation", "Digestive Care", "Joint & Bone Health",
+    "Heart Care", "Diabetes Care", "Weight Management", "Hair Care", "Stress & Anxiety Relief",
+    "Energy & Vitality", "Women's Wellness", "Men's Wellness", "Kids' Health", "Liver Detox", "Collagen",
+]
+BENEFITS = [
+    "Stress Relief", "Better Sleep", "Digestion", "Immunity", "Energy", "Skin Glow", "Hair Growth", "Joint Support",
+    "Blood Sugar", "Heart Health", "Weight Loss", "Detox", "Focus", "Respiratory", "Hormone Balance",
+    "Muscle Recovery", "Liver Support", "Eye Health", "Bone Strength", "Anti-Ageing",
+]
+HERBS = [
+    "Ashwagandha", "Tulsi", "Turmeric", "Brahmi", "Shatavari", "Moringa", "Neem", "Amla", "Triphala", "Giloy",
+    "Shilajit", "Arjuna", "Guduchi", "Gokshura", "Safed Musli", "Punarnava", "Jatamansi", "Haritaki", "Ginger",
+    "Fenugreek", "Karela", "Jamun", "Licorice", "Cinnamon", "Saffron", "Bhringraj", "Manjistha", "Kalonji",
+]
+FORMS = ["Capsules", "Tablets", "Powder", "Drops", "Juice", "Tea", "Oil", "Gummies", "Extract", "Churna"]
+QUALIFIERS = ["Organic", "Pure", "Ayurvedic", "Premium", "Herbal", "Wild", "Cold-Pressed", "Daily", "Advanced", "Classic"]
+
+
+def batched(rows, size):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def insert(cursor, conn, sql, rows, batch):
+    # pymysql folds executemany on INSERT ... VALUES into multi-row statements
+    for chunk in batched(rows, batch):
+        cursor.executemany(sql, chunk)
+        conn.commit()
+
+
+def product_rows(rng, count, category_count, now):
+    for i in range(1, count + 1):
+        herb = rng.choice(HERBS)
+        form = rng.choice(FORMS)
+        name = f"{rng.choice(QUALIFIERS)} {herb} {form}"
+        if rng.random() < 0.3:
+            name += f" {rng.choice([60, 90, 120, 250, 500])}{'ml' if form in ('Juice', 'Oil', 'Drops') else 'g'}"
+        base_price = None if rng.random() < 0.02 else round(rng.uniform(99, 2999), 2)
+        sale_price = round(base_price * rng.uniform(0.6, 0.95), 2) if base_price and rng.random() < 0.25 else None
+        created_at = now - datetime.timedelta(days=rng.uniform(0, 730))
+        yield (
+            name,
+            f"{name.lower().replace(' ', '-').replace('&', 'and')}-{i}",
+            base_price,
+            sale_price,
+            "₹",
+            f"{herb} {form.lower()} for {rng.choice(BENEFITS).lower()} and {rng.choice(BENEFITS).lower()}. "
+            f"Made with {rng.choice(HERBS)} and {rng.choice(HERBS)} following traditional Ayurvedic recipes.",
+            f"{herb} for {rng.choice(BENEFITS).lower()}",
+            None if rng.random() < 0.1 else rng.randint(0, 500),
+            int(rng.random() < 0.05),
+            None if rng.random() < 0.03 else rng.randint(1, category_count),
+            created_at,
+            created_at + datetime.timedelta(days=rng.uniform(0, 30)),
+            f"/uploads/products/{i}-thumb.webp",
+            f"/uploads/products/{i}.webp",
+            f"RB-{i:07d}",
+            int(rng.random() > 0.05),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--categories", type=int, default=len(CATEGORIES))
+    parser.add_argument("--health-benefits", type=int, default=len(BENEFITS))
+    parser.add_argument("--batch", type=int, default=2000, help="rows per INSERT statement")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="delete existing catalog and order rows first")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    now = datetime.datetime.now().replace(microsecond=0)
+    started = time.perf_counter()
+    config = backend.get_db_config()
+    conn = backend._connect(config)
+    cursor = conn.cursor()
+    for statement in CATALOG_TABLES.split(";"):
+        cursor.execute(statement)
+    conn.commit()
+    applied = backend.migrate()
+    print(f"Schema ready ({len(applied)} migration(s) applied)")
+
+    cursor.execute("SELECT COUNT(*) AS c FROM products")
+    existing = cursor.fetchone()["c"]
+    if existing and not args.reset:
+        print(f"{config['database']} already has {existing} products; pass --reset to replace them")
+        return 1
+    if args.reset:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in RESET_TABLES:
+            cursor.execute(f"TRUNCATE TABLE {table}")
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        conn.commit()
+
+    categories = [(CATEGORIES[i % len(CATEGORIES)] + (f" {i // len(CATEGORIES) + 1}" if i >= len(CATEGORIES) else ""),) for i in range(args.categories)]
+    insert(cursor, conn, "INSERT INTO categories (name) VALUES (%s)", categories, args.batch)
+    benefits = [(BENEFITS[i % len(BENEFITS)] + (f" {i // len(BENEFITS) + 1}" if i >= len(BENEFITS) else ""),) for i in range(args.health_benefits)]
+    insert(cursor, conn, "INSERT INTO health_benefits (name) VALUES (%s)", benefits, args.batch)
+
+    products = list(product_rows(rng, args.products, args.categories, now))
+    insert(
+        cursor, conn,
+        """
+        INSERT INTO products (name, slug, base_price, sale_price, base_currency, description, short_description,
+                              stock_quantity, featured, category_id, created_at, updated_at, thumbnail_url,
+                              image_url, sku, is_active)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """,
+        products, args.batch,
+    )
+    print(f"  {len(products)} products")
+
+    links = []
+    for product_id in range(1, args.products + 1):
+        for benefit_id in rng.sample(range(1, args.health_benefits + 1), rng.randint(1, 3)):
+            links.append((product_id, benefit_id))
+    insert(cursor, conn, "INSERT INTO product_health_benefits (product_id, health_benefit_id) VALUES (%s, %s)", links, args.batch)
+    print(f"  {len(links)} health-benefit links")
+
+    # Order history over the last 90 days, skewed towards a popular head of the catalog
+    orders, items = [], []
+    for order_id in range(1, args.orders + 1):
+        created_at = now - datetime.timedelta(days=rng.uniform(0, 90))
+        lines = {}
+        for _ in range(rng.randint(1, 4)):
+            product_id = min(int(rng.paretovariate(1.2)), args.products) if rng.random() < 0.7 else rng.randint(1, args.products)
+            lines[product_id] = lines.get(product_id, 0) + rng.randint(1, 3)
+        total = 0.0
+        for product_id, quantity in lines.items():
+            product = products[product_id - 1]
+            price = product[3] or product[2] or 0.0
+            total += price * quantity
+            items.append((order_id, product_id, product[0], quantity, price, round(price * quantity, 2)))
+        orders.append((order_id, f"Customer {order_id}", f"customer{order_id}@example.com", "9000000000",
+                       "1 Bench Street, Test City", round(total, 2), "₹", "pending", created_at))
+    insert(
+        cursor, conn,
+        """
+        INSERT INTO orders (id, customer_name, customer_email, customer_phone, shipping_address,
+                            total_amount, currency_symbol, status, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """,
+        orders, args.batch,
+    )
+    insert(
+        cursor, conn,
+        """
+        INSERT INTO order_items (order_id, product_id, product_name, quantity, price, subtotal)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+        items, args.batch,
+    )
+    print(f"  {len(orders)} orders, {len(items)} order items")
+    cursor.execute("ANALYZE TABLE products, product_health_benefits, orders, order_items")
+    cursor.fetchall()
+    conn.close()
+
+    backend.backfill_sales()
+    print(f"Seeded {config['database']} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
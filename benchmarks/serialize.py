@@ -0,0 +1,99 @@
+"""
+Micro-benchmark for the product listing serialization path.
+
+Measures, per 1,000 products, the time spent turning DB rows (as DictCursor
+returns them: Decimal prices, datetime created_at) into listing JSON:
+  - serialize: serialize_product() over every row
+  - encode:    Flask's stock provider vs the app's providers (stdlib json
+               with the fast date path, and orjson when installed)
+
+No database is needed; rows are synthetic.
+
+Usage:
+    python benchmarks/serialize.py [--products 1000] [--repeat 50]
+"""
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DB_HOSTNAME", "db.invalid")
+os.environ.setdefault("DB_USER", "benchmark")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+import backend  # noqa: E402
+
+
+def make_rows(count):
+    created = datetime.datetime(2024, 1, 1, 9, 30)
+    return [
+        {
+            "id": i,
+            "name": f"Ashwagandha Root Extract {i}",
+            "slug": f"ashwagandha-root-extract-{i}",
+            "base_price": Decimal("499.00") + i % 300,
+            "sale_price": Decimal("449.00") if i % 3 == 0 else None,
+            "base_currency": "₹",
+            "description": "Supports stress relief and restful sleep. " * 8,
+            "short_description": "Stress relief",
+            "stock_quantity": 25 + i % 40,
+            "featured": i % 10 == 0,
+            "category_id": 1 + i % 8,
+            "created_at": created + datetime.timedelta(minutes=i),
+            "thumbnail_url": f"/uploads/products/{i}-thumb.png",
+            "image_url": f"/uploads/products/{i}.png",
+            "sku": f"RB-{i:06d}",
+            "category_name": "Stress & Anxiety Relief",
+        }
+        for i in range(count)
+    ]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.products)
+    scale = 1000 / args.products
+    serialize = timed(lambda: [backend.serialize_product(r) for r in rows], args.repeat)
+    products = [backend.serialize_product(r) for r in rows]
+    payload = {"products": products, "total": len(products), "pages": 1}
+
+    providers = [("flask", backend.DefaultJSONProvider), ("stdlib", backend.StorefrontJSONProvider)]
+    if backend.orjson is not None:
+        providers.append(("orjson", backend.OrjsonProvider))
+    else:
+        print("(orjson not installed - only the stdlib encoder is measured)")
+
+    print("=" * 60)
+    print(f"Listing serialization, median of {args.repeat} runs, per 1k products")
+    print("=" * 60)
+    print(f"  serialize_product        {serialize * scale * 1000:8.2f} ms")
+    for name, provider_class in providers:
+        app = backend.Flask(__name__)
+        provider = provider_class(app)
+        with app.app_context():
+            encode = timed(lambda: provider.response(payload).get_data(), args.repeat)
+        print(f"  encode ({name:6})          {encode * scale * 1000:8.2f} ms")
+        print(f"  serialize + encode       {(serialize + encode) * scale * 1000:8.2f} ms")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Cold-start benchmark for backend.create_app().
+
+Each run starts a fresh interpreter, imports backend and builds the app, the
+way a gunicorn worker does on boot or on an autoscale event. pymysql.connect
+is replaced with a function that raises, so any database access during
+startup fails the run.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--target-ms 400]
+
+Exits non-zero if the median startup time exceeds the target or if startup
+touched the database.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, time
+started = time.perf_counter()
+import pymysql
+
+def refuse(**kwargs):
+    raise RuntimeError("create_app() opened a database connection")
+
+pymysql.connect = refuse
+import backend
+imported = time.perf_counter()
+backend.create_app()
+created = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "create_app_ms": (created - imported) * 1000}))
+"""
+
+
+def run_once():
+    env = dict(os.environ)
+    # Config must be present, but nothing may connect with it
+    env.setdefault("DB_HOSTNAME", "db.invalid")
+    env.setdefault("DB_USER", "startup-benchmark")
+    env.setdefault("DB_NAME", "startup_benchmark")
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "startup failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target-ms", type=float, default=float(os.environ.get("STARTUP_TARGET_MS", "400")))
+    args = parser.parse_args()
+
+    samples = []
+    for _ in range(args.runs):
+        try:
+            samples.append(run_once())
+        except RuntimeError as e:
+            print(f"FAIL: {e}")
+            return 1
+
+    totals = [s["import_ms"] + s["create_app_ms"] for s in samples]
+    print("=" * 60)
+    print(f"Cold start over {args.runs} runs")
+    print("=" * 60)
+    print(f"  import backend   median {statistics.median(s['import_ms'] for s in samples):8.1f} ms")
+    print(f"  create_app()     median {statistics.median(s['create_app_ms'] for s in samples):8.1f} ms")
+    print(f"  total            median {statistics.median(totals):8.1f} ms   max {max(totals):8.1f} ms")
+    print(f"  target           {args.target_ms:15.1f} ms")
+    print("=" * 60)
+    if statistics.median(totals) > args.target_ms:
+        print("FAIL: median startup is over target")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import React, { useEffect, useMemo, useState } from 'react';
 import { Link } from 'react-router-dom';
 import ProductCard from './ProductCard';
 import { ProductCardSkeleton } from './Skeleton';
-import { getPublicProducts } from '../services/api';
+import { getBestSellers, getPublicProducts } from '../services/api';
 
 const CloneBestSellers = () => {
   const [loading, setLoading] = useState(true);
@@ -13,8 +13,14 @@ const CloneBestSellers = () => {
     const run = async () => {
       setLoading(true);
       try {
-        const data = await getPublicProducts({ page: 1, per_page: 4, sort_by: 'created_at', sort_order: 'desc' });
-        setProducts(data.products || []);
+        const data = await getBestSellers({ window: 30, limit: 4 });
+        if (data.products && data.products.length) {
+          setProducts(data.products);
+        } else {
+          // No sales yet: fall back to the newest products
+          const latest = await getPublicProducts({ page: 1, per_page: 4, sort_by: 'created_at', sort_order: 'desc', include_total: false });
+          setProducts(latest.products || []);
+        }
       } catch (e) {
         setProducts([]);
       } finally {
@@ -51,6 +51,15 @@ export const WishlistProvider = ({ children }) => {
 
   const clearWishlist = () => setWishlistItems([]);
 
+  // Swap saved snapshots for fresh product data and drop products that are gone
+  const refreshWishlist = (products, missing) => {
+    const fresh = new Map(products.map((product) => [product.id, product]));
+    const gone = new Set(missing);
+    setWishlistItems((prev) =>
+      prev.filter((item) => !gone.has(item.id)).map((item) => fresh.get(item.id) || item)
+    );
+  };
+
   const getWishlistCount = () => wishlistItems.length;
 
   return (
@@ -61,6 +70,7 @@ export const WishlistProvider = ({ children }) => {
         removeFromWishlist,
         toggleWishlist,
         clearWishlist,
+        refreshWishlist,
         isInWishlist,
         getWishlistCount,
       }}
@@ -1,7 +1,7 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useCart } from '../context/CartContext';
-import { createOrder } from '../services/api';
+import { createOrder, getCartQuote } from '../services/api';
 import CloneFooter from '../components/CloneFooter';
 
 const Checkout = () => {
@@ -9,6 +9,7 @@ const Checkout = () => {
   const navigate = useNavigate();
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
+  const [quote, setQuote] = useState(null);
   const [formData, setFormData] = useState({
     customer_name: '',
     customer_email: '',
@@ -16,6 +17,32 @@ const Checkout = () => {
     shipping_address: '',
   });
 
+  // Server-side prices and stock; the summary falls back to cart prices until it arrives
+  useEffect(() => {
+    if (cartItems.length === 0) {
+      setQuote(null);
+      return undefined;
+    }
+    let cancelled = false;
+    getCartQuote(cartItems.map((item) => ({ product_id: item.productId, quantity: item.quantity || 1 })))
+      .then((data) => {
+        if (!cancelled) setQuote(data.quote);
+      })
+      .catch((err) => {
+        console.error('Error fetching cart quote:', err);
+        if (!cancelled) setQuote(null);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [cartItems]);
+
+  const quotedLines = {};
+  (quote?.items || []).forEach((line) => {
+    quotedLines[line.product_id] = line;
+  });
+  const totalPrice = quote ? quote.total : getTotalPrice() || 0;
+
   const handleChange = (e) => {
     setFormData({
       ...formData,
@@ -175,21 +202,33 @@ const Checkout = () => {
             
             <div className="space-y-2 mb-4">
               {cartItems.map((item) => {
+                const line = quotedLines[item.productId];
                 const itemPrice = item.salePrice || item.price || 0;
-                const itemTotal = itemPrice * (item.quantity || 1);
+                const itemTotal = line ? line.subtotal : itemPrice * (item.quantity || 1);
                 return (
                   <div key={item.productId} className="flex justify-between text-sm">
-                    <span>{item.name} x{item.quantity || 1}</span>
+                    <span>
+                      {item.name} x{item.quantity || 1}
+                      {line && !line.in_stock && <span className="text-red-600"> (only {line.stock_quantity} left)</span>}
+                    </span>
                     <span>₹{itemTotal.toFixed(2)}</span>
                   </div>
                 );
               })}
             </div>
 
+            {quote && !quote.orderable && (
+              <div className="bg-yellow-100 border border-yellow-400 text-yellow-800 px-3 py-2 rounded mb-4 text-sm">
+                {quote.missing.length > 0
+                  ? 'Some items in your cart are no longer available. Please remove them to place the order.'
+                  : 'Some items do not have enough stock. Please reduce their quantity.'}
+              </div>
+            )}
+
             <div className="border-t pt-4 space-y-2">
               <div className="flex justify-between">
                 <span>Subtotal</span>
-                <span>₹{(getTotalPrice() || 0).toFixed(2)}</span>
+                <span>₹{totalPrice.toFixed(2)}</span>
               </div>
               <div className="flex justify-between">
                 <span>Shipping</span>
@@ -197,7 +236,7 @@ const Checkout = () => {
               </div>
               <div className="flex justify-between font-bold text-lg pt-2 border-t">
                 <span>Total</span>
-                <span>₹{(getTotalPrice() || 0).toFixed(2)}</span>
+                <span>₹{totalPrice.toFixed(2)}</span>
               </div>
             </div>
           </div>
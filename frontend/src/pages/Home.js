@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
-import { getPublicProducts, getPublicHealthBenefits } from '../services/api';
+import { getHomeFeed } from '../services/api';
 import ProductCard from '../components/ProductCard';
 import HeroSlider from '../components/HeroSlider';
 
@@ -12,12 +12,9 @@ const Home = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [productsData, healthData] = await Promise.all([
-          getPublicProducts({ featured: true, per_page: 4 }),
-          getPublicHealthBenefits(),
-        ]);
-        setBestSellers(productsData.products || []);
-        setHealthBenefits(healthData.health_benefits || []);
+        const feed = await getHomeFeed();
+        setBestSellers((feed.featured || []).slice(0, 4));
+        setHealthBenefits(feed.health_benefits || []);
       } catch (error) {
         console.error('Error fetching data:', error);
       } finally {
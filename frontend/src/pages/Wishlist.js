@@ -1,13 +1,41 @@
-import React from 'react';
+import React, { useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import ProductCard from '../components/ProductCard';
 import CloneFooter from '../components/CloneFooter';
 import { useWishlist } from '../context/WishlistContext';
+import { getPublicProductsByIds } from '../services/api';
+
+const BATCH_SIZE = 100;
 
 const Wishlist = () => {
-  const { wishlistItems, clearWishlist } = useWishlist();
+  const { wishlistItems, clearWishlist, refreshWishlist } = useWishlist();
   const hasItems = wishlistItems.length > 0;
 
+  // Saved items keep the price they had when added; refresh them once per visit
+  useEffect(() => {
+    const ids = wishlistItems.map((item) => item.id);
+    if (ids.length === 0) return undefined;
+    let cancelled = false;
+    const batches = [];
+    for (let start = 0; start < ids.length; start += BATCH_SIZE) {
+      batches.push(getPublicProductsByIds(ids.slice(start, start + BATCH_SIZE), 'card'));
+    }
+    Promise.all(batches)
+      .then((results) => {
+        if (!cancelled) {
+          refreshWishlist(
+            results.flatMap((data) => data.products || []),
+            results.flatMap((data) => data.missing || [])
+          );
+        }
+      })
+      .catch((error) => console.error('Error refreshing wishlist:', error));
+    return () => {
+      cancelled = true;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, []);
+
   return (
     <div className="bg-gray-50 min-h-screen flex flex-col">
       <div className="container mx-auto px-4">
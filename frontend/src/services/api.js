@@ -29,8 +29,26 @@ const api = axios.create({
 });
 
 // Public API endpoints
+// Listings only render product cards, so ask for the card fields unless the caller overrides it.
 export const getPublicProducts = async (params) => {
-  const response = await api.get('/public/products', { params });
+  const response = await api.get('/public/products', { params: { fields: 'card', ...params } });
+  return response.data;
+};
+
+// Fetch many products in one request, at most 100 ids (BATCH_MAX_IDS) per call.
+// Resolves to { products: [...in the requested order], missing: [ids not found] }.
+export const getPublicProductsByIds = async (productIds, fields) => {
+  const response = await api.get('/public/products', { params: { ids: productIds.join(','), fields } });
+  return response.data;
+};
+
+export const getHomeFeed = async () => {
+  const response = await api.get('/public/home');
+  return response.data;
+};
+
+export const getBestSellers = async (params = {}) => {
+  const response = await api.get('/public/best-sellers', { params });
   return response.data;
 };
 
@@ -49,6 +67,13 @@ export const getPublicHealthBenefits = async () => {
   return response.data;
 };
 
+// Price a cart on the server: items are [{ product_id, quantity }].
+// Resolves to { quote: { items, missing, total, currency_symbol, orderable } }.
+export const getCartQuote = async (items) => {
+  const response = await api.post('/public/cart/quote', { items });
+  return response.data;
+};
+
 export const createOrder = async (orderData) => {
   const response = await api.post('/public/orders', orderData);
   return response.data;